@@ -2,27 +2,115 @@
 
 from __future__ import annotations
 
+import atexit
+import base64
 import hashlib
 import json
+import mmap
+import os
+import platform
+import queue
+import ssl
 import threading
-from dataclasses import dataclass, asdict
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Optional
+
+from agents.clock import utc_now
+
+try:  # Optional C-extension JSON encoder; stdlib fallback keeps imports safe.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
 
 
 CHAIN_FILE = Path("artifacts/chain.log")
 
+# Sentinel prev_hash for the first block; stored literally in the log.
+GENESIS = b"GENESIS"
+
+
+def _encode_hash(digest: bytes) -> str:
+    if digest == GENESIS:
+        return "GENESIS"
+    return base64.b64encode(digest).decode("ascii")
+
+
+def _decode_hash(text: str) -> bytes:
+    if text == "GENESIS":
+        return GENESIS
+    # Legacy logs stored SHA-256 digests as 64 hex chars; that length is
+    # unambiguous (base64 of a 32-byte digest is 44 chars) but would
+    # "successfully" base64-decode into 48 bytes of garbage, so try hex
+    # first and fall through for anything that isn't.
+    if len(text) == 64:
+        try:
+            return bytes.fromhex(text)
+        except ValueError:
+            pass
+    return base64.b64decode(text)
+
+
+def cpu_has_sha_ni() -> bool:
+    """Best-effort probe for x86 SHA-NI support (Linux /proc/cpuinfo only)."""
+    if platform.machine() not in {"x86_64", "AMD64"}:
+        return False
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as handle:
+            return "sha_ni" in handle.read()
+    except OSError:
+        return False
+
+
+def hash_acceleration_info() -> Dict[str, object]:
+    """Report whether per-block SHA-256 can use hardware acceleration.
+
+    hashlib dispatches to OpenSSL, which uses the SHA-NI instructions when
+    both the CPU and the OpenSSL build support them (OpenSSL >= 1.1.1).
+    This is diagnostic only; the chain works either way.
+    """
+    return {
+        "openssl_version": ssl.OPENSSL_VERSION,
+        "cpu_sha_ni": cpu_has_sha_ni(),
+        "sha256_available": "sha256" in hashlib.algorithms_available,
+    }
+
+
+def _dumps_canonical(payload: Dict[str, object]) -> bytes:
+    """Serialize a payload to canonical (sorted-key, compact) JSON bytes.
+
+    Deliberately stays on stdlib json even when orjson is available:
+    orjson formats float exponents differently (1e28 vs 1e+28), so a
+    chain hashed through whichever encoder happens to be installed
+    would stop verifying in an environment with the other one. Same
+    reasoning as llm_agent._content_sha256; ensure_ascii=False keeps
+    non-ASCII payload text as raw UTF-8.
+    """
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(line: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
 
 def _utc_timestamp() -> str:
-    return datetime.now(tz=timezone.utc).isoformat()
+    return utc_now()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Block:
     index: int
-    prev_hash: str
-    hash: str
+    prev_hash: bytes
+    hash: bytes
     section: str
     record_id: str
     timestamp: str
@@ -32,47 +120,125 @@ class Block:
 class BloomChainAdapter:
     """Append-only hash chain fed by ledger create events."""
 
-    def __init__(self, path: Path = CHAIN_FILE) -> None:
+    def __init__(self, path: Path = CHAIN_FILE, flush_interval: int = 64) -> None:
         self.path = path
-        self._lock = threading.RLock()
+        self.flush_interval = max(1, flush_interval)
+        # Plain Lock: no method re-enters while holding it, and it skips the
+        # owner/depth bookkeeping RLock pays on every acquire.
+        self._lock = threading.Lock()
         self._chain: list[Block] = []
-        if self.path.exists():
-            for line in self.path.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
-                    continue
-                block_dict = json.loads(line)
-                self._chain.append(Block(**block_dict))
+        self._verified_upto = 0
+        self._fh: Optional[BinaryIO] = None
+        self._io_lock = threading.Lock()
+        self._q: "queue.Queue[bytes]" = queue.Queue(maxsize=4096)
+        # First write failure from the writer thread; once set, the
+        # on-disk log is missing a batch, so it is re-raised on every
+        # later append/flush rather than cleared.
+        self._write_error: Optional[Exception] = None
+        # A tail loaded from disk is checked once before the first
+        # append; blocks we built ourselves are trusted after that.
+        self._tail_checked = True
+        if self.path.exists() and self.path.stat().st_size:
+            # Stream the log via mmap instead of materialising the whole
+            # file (plus a splitlines copy) as Python strings up front.
+            with self.path.open("rb") as handle:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    for line in iter(mapped.readline, b""):
+                        if not line.strip():
+                            continue
+                        block_dict = _loads(line)
+                        block_dict["prev_hash"] = _decode_hash(block_dict["prev_hash"])
+                        block_dict["hash"] = _decode_hash(block_dict["hash"])
+                        self._chain.append(Block(**block_dict))
+                finally:
+                    mapped.close()
+            self._tail_checked = not self._chain
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="bloom-chain-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.flush)
 
     # ------------------------------------------------------------------ #
     # Public interface                                                   #
     # ------------------------------------------------------------------ #
 
-    def append_event(self, section: str, record_id: str, payload: Dict[str, object]) -> str:
+    def append_event(
+        self,
+        section: str,
+        record_id: str,
+        payload: Dict[str, object],
+        durable: bool = False,
+    ) -> str:
+        self._raise_pending_write_error()
         with self._lock:
+            if not self._tail_checked:
+                if not self._tail_intact():
+                    raise RuntimeError(
+                        "refusing to append: loaded chain tail fails verification"
+                    )
+                self._tail_checked = True
             enriched_payload = {
                 "type": section,
                 "record_id": record_id,
                 "data": payload,
             }
-            block = self._build_block(section, record_id, enriched_payload)
+            block, payload_bytes = self._build_block(section, record_id, enriched_payload)
             self._chain.append(block)
-            self._write_block(block)
-            return block.hash
+            self._write_block(block, payload_bytes)
+        if durable:
+            self.flush(fsync=True)
+        return _encode_hash(block.hash)
 
     def record_event(self, section: str, record_id: str, payload: Dict[str, object]) -> str:
         """Compatibility shim for legacy JsonStateStore listeners."""
         return self.append_event(section, record_id, payload)
 
-    def verify(self) -> bool:
-        prev_hash = "GENESIS"
-        for block in self._chain:
-            if block.prev_hash != prev_hash:
-                return False
-            expected = self._compute_hash(block.index, block.prev_hash, block.payload)
-            if expected != block.hash:
-                return False
-            prev_hash = block.hash
-        return True
+    def verify(self, full: bool = False) -> bool:
+        """Check chain linkage and hashes.
+
+        The chain is append-only, so blocks verified once stay verified;
+        by default only blocks appended since the last successful call are
+        rechecked. Pass ``full=True`` to re-verify from genesis.
+        """
+        with self._lock:
+            start = 0 if full else self._verified_upto
+            prev_hash = self._chain[start - 1].hash if start else GENESIS
+            for block in self._chain[start:]:
+                if block.prev_hash != prev_hash:
+                    return False
+                expected = self._compute_hash(
+                    block.index, block.prev_hash, _dumps_canonical(block.payload)
+                )
+                if expected != block.hash:
+                    return False
+                prev_hash = block.hash
+            self._verified_upto = len(self._chain)
+            return True
+
+    def verify_tail(self, k: int = 1) -> bool:
+        """Check only the last ``k`` links of the chain.
+
+        Constant-time steady-state check after appends; use :meth:`verify`
+        (or ``verify(full=True)`` after crash recovery) for a whole-chain
+        audit.
+        """
+        with self._lock:
+            if not self._chain:
+                return True
+            start = max(len(self._chain) - k, 0)
+            prev_hash = self._chain[start - 1].hash if start else GENESIS
+            for block in self._chain[start:]:
+                if block.prev_hash != prev_hash:
+                    return False
+                expected = self._compute_hash(
+                    block.index, block.prev_hash, _dumps_canonical(block.payload)
+                )
+                if expected != block.hash:
+                    return False
+                prev_hash = block.hash
+            return True
 
     def blocks(self) -> Iterable[Block]:
         with self._lock:
@@ -82,12 +248,39 @@ class BloomChainAdapter:
     # Internal helpers                                                   #
     # ------------------------------------------------------------------ #
 
-    def _build_block(self, section: str, record_id: str, payload: Dict[str, object]) -> Block:
+    def _tail_intact(self) -> bool:
+        """Re-hash the last loaded block; caller holds ``self._lock``.
+
+        Guards against chaining new blocks onto a corrupt (or
+        misdecoded) tail, which would permanently bake the bad hash
+        into the log.
+        """
+        block = self._chain[-1]
+        prev_hash = self._chain[-2].hash if len(self._chain) > 1 else GENESIS
+        if block.prev_hash != prev_hash:
+            return False
+        expected = self._compute_hash(
+            block.index, block.prev_hash, _dumps_canonical(block.payload)
+        )
+        return expected == block.hash
+
+    def _build_block(
+        self,
+        section: str,
+        record_id: str,
+        payload: Dict[str, object],
+    ) -> tuple[Block, bytes]:
+        """Build the next block, returning it with its canonical payload bytes.
+
+        The payload is serialized exactly once; the same bytes feed both the
+        block hash and the on-disk line.
+        """
         index = len(self._chain)
-        prev_hash = self._chain[-1].hash if self._chain else "GENESIS"
+        prev_hash = self._chain[-1].hash if self._chain else GENESIS
         timestamp = _utc_timestamp()
-        block_hash = self._compute_hash(index, prev_hash, payload)
-        return Block(
+        payload_bytes = _dumps_canonical(payload)
+        block_hash = self._compute_hash(index, prev_hash, payload_bytes)
+        block = Block(
             index=index,
             prev_hash=prev_hash,
             hash=block_hash,
@@ -96,23 +289,96 @@ class BloomChainAdapter:
             timestamp=timestamp,
             payload=payload,
         )
+        return block, payload_bytes
 
     @staticmethod
     def _compute_hash(
         index: int,
-        prev_hash: str,
-        payload: Dict[str, object],
-    ) -> str:
-        message = f"{index}|{prev_hash}|{json.dumps(payload, sort_keys=True)}".encode("utf-8")
-        return hashlib.sha256(message).hexdigest()
+        prev_hash: bytes,
+        payload_bytes: bytes,
+    ) -> bytes:
+        message = b"%d|%s|%s" % (index, prev_hash, payload_bytes)
+        return hashlib.sha256(message).digest()
+
+    def _write_block(self, block: Block, payload_bytes: bytes) -> None:
+        # Splice the already-serialized payload into the line instead of
+        # re-serializing the whole block dict.
+        line = b'{"index":%d,"prev_hash":"%s","hash":"%s","section":%s,"record_id":%s,"timestamp":"%s","payload":%s}\n' % (
+            block.index,
+            _encode_hash(block.prev_hash).encode("ascii"),
+            _encode_hash(block.hash).encode("ascii"),
+            _dumps_compact(block.section),
+            _dumps_compact(block.record_id),
+            block.timestamp.encode("utf-8"),
+            payload_bytes,
+        )
+        self._q.put(line)
+
+    def _writer_loop(self) -> None:
+        """Drain queued block lines and write each batch with one syscall.
+
+        Runs on a dedicated daemon thread so state writers never block on
+        chain I/O; they only pay for hashing and an enqueue.
+        """
+        while True:
+            lines = [self._q.get()]
+            while len(lines) < self.flush_interval:
+                try:
+                    lines.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_lines(lines)
+            except Exception as exc:  # noqa: BLE001 - re-raised on the caller's thread
+                # Keep the thread alive and the queue draining (task_done
+                # below, so flush() can never deadlock on q.join); the
+                # failure surfaces from append_event()/flush() instead.
+                if self._write_error is None:
+                    self._write_error = exc
+            finally:
+                for _ in lines:
+                    self._q.task_done()
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        with self._io_lock:
+            if self._fh is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = self.path.open("ab", buffering=1 << 20)
+            self._fh.write(b"".join(lines))
+            self._fh.flush()
+
+    def _raise_pending_write_error(self) -> None:
+        if self._write_error is not None:
+            raise RuntimeError(
+                "bloom chain writer failed; the on-disk log is incomplete"
+            ) from self._write_error
+
+    def flush(self, fsync: bool = False) -> None:
+        """Block until all queued lines have been written to disk.
+
+        Raises if the writer thread failed to persist any batch, so the
+        durable path keeps the synchronous write's error guarantee.
+        """
+        self._q.join()
+        self._raise_pending_write_error()
+        with self._io_lock:
+            if self._fh is not None:
+                self._fh.flush()
+                if fsync:
+                    os.fsync(self._fh.fileno())
+
+
+@lru_cache(maxsize=8)
+def adapter_for(path: Path = CHAIN_FILE) -> BloomChainAdapter:
+    """Return the shared adapter for ``path``, loading the log only once.
 
-    def _write_block(self, block: Block) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(asdict(block), separators=(",", ":")) + "\n")
+    CLI entry points should use this instead of constructing adapters
+    directly so repeated commands in one process skip the O(file) reload.
+    """
+    return BloomChainAdapter(path)
 
 
-_ADAPTER = BloomChainAdapter()
+_ADAPTER = adapter_for()
 
 
 def adapter() -> BloomChainAdapter:
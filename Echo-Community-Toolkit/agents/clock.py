@@ -0,0 +1,25 @@
+"""Timestamp helper shared by the agents: cached per-second UTC formatting."""
+
+from __future__ import annotations
+
+import time
+
+# (epoch second, formatted prefix); refreshed when the second ticks over.
+_last_sec: tuple[int, str] = (0, "")
+
+
+def utc_now() -> str:
+    """Return an ISO-8601 UTC timestamp with microseconds (``...Z``).
+
+    datetime.now(timezone.utc).isoformat() allocates a datetime and formats
+    the full string on every call; here the second-resolution prefix is
+    formatted once per second and reused, leaving only the microsecond
+    suffix per call. A racing refresh just recomputes the same prefix.
+    """
+    global _last_sec
+    now = time.time()
+    sec = int(now)
+    micros = int((now - sec) * 1_000_000)
+    if _last_sec[0] != sec:
+        _last_sec = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+    return f"{_last_sec[1]}.{micros:06d}Z"
@@ -3,67 +3,111 @@
 from __future__ import annotations
 
 import argparse
-import json
+import atexit
 import uuid
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
 import numpy as np
 
-from agents.bloom_chain import BloomChainAdapter
+from agents import jsonio
+from agents.clock import utc_now
+from agents.bloom_chain import adapter_for
 from agents.state import JsonStateStore
-from src.g2v.fft_codec import fft_encode, ifft_decode
+from src.g2v.fft_codec import FFT_KW, fft2, ifft2
 from src.g2v.volume import glyph_from_tink_token
 
 
 def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return utc_now()
+
+
+# Glyph construction is deterministic in (token, size); batch pipelines often
+# request the same pair repeatedly, so cache the master copy.
+_glyph_from_token = lru_cache(maxsize=256)(glyph_from_tink_token)
+
+
+def _analyze_matrix(matrix: np.ndarray) -> Tuple[float, float]:
+    """Return (mse, fft_mean) from a single forward transform.
+
+    Works on the unshifted spectrum: both the round-trip MSE and the mean
+    magnitude are invariant under fftshift, so skipping the shift/unshift
+    pair saves two full-size reorder copies. The reconstruction error is
+    squared in place, leaving one spectrum, one reconstruction, and one
+    magnitude array as the only temporaries.
+    """
+    spectrum = fft2(np.asarray(matrix, float), **FFT_KW)
+    recon = np.real(ifft2(spectrum, **FFT_KW))
+    recon -= matrix
+    np.square(recon, out=recon)
+    mse = float(recon.mean())
+    fft_mean = float(np.abs(spectrum).mean())
+    return mse, fft_mean
 
 
 class GlyphAgent:
     """Wraps G2V glyph generation and FFT analysis with shared-state logging."""
 
-    def __init__(self, state_store: JsonStateStore, artifact_dir: str | Path = "artifacts/glyphs") -> None:
+    def __init__(
+        self,
+        state_store: JsonStateStore,
+        artifact_dir: str | Path = "artifacts/glyphs",
+        flush_threshold: int = 64,
+    ) -> None:
         self.state = state_store
         self.artifact_dir = Path(artifact_dir)
         self.artifact_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_threshold = max(1, flush_threshold)
+        self._pending: dict[str, np.ndarray] = {}
+        self._batch_path = self._new_batch_path()
+        # State records point at the batch archive before it exists on
+        # disk; make sure buffered matrices land there even if the caller
+        # never flushes (same guarantee BloomChainAdapter gives its log).
+        atexit.register(self.flush)
 
     # ------------------------------------------------------------------ #
     # Core operations                                                    #
     # ------------------------------------------------------------------ #
 
     def generate_glyph(self, token: str, size: int = 32) -> Tuple[str, np.ndarray]:
-        """Create a glyph matrix from token and register it in state."""
-        matrix = glyph_from_tink_token(token, size)
-        matrix = np.asarray(matrix, dtype=float)
+        """Create a glyph matrix from token and register it in state.
+
+        Matrices are buffered in memory and flushed to a shared ``.npz``
+        archive (one file per batch) instead of one ``np.save`` per glyph;
+        call :meth:`flush` to force the current batch to disk.
+        """
+        # np.array copies so callers can't mutate the cached master matrix.
+        matrix = np.array(_glyph_from_token(token, size), dtype=float)
 
         glyph_id = self._new_glyph_id()
-        file_path = self.artifact_dir / f"{glyph_id}.npy"
-        np.save(file_path, matrix)
+        self._pending[glyph_id] = matrix
 
         record = {
             "token": token,
             "size": size,
-            "file": str(file_path),
+            "file": str(self._batch_path),
+            "key": glyph_id,
             "created": _utc_now(),
         }
         self.state.create_record("glyphs", record, record_id=glyph_id)
+        if len(self._pending) >= self.flush_threshold:
+            self.flush()
         return glyph_id, matrix
 
+    def flush(self) -> None:
+        """Write buffered glyph matrices to the current batch archive."""
+        if not self._pending:
+            return
+        np.savez(self._batch_path, **self._pending)
+        self._pending.clear()
+        self._batch_path = self._new_batch_path()
+
     def analyze_glyph_fft(self, glyph_id: str) -> Tuple[str, dict]:
         """Perform FFT round-trip and log spectral metrics."""
         glyph_record = self.state.get_record("glyphs", glyph_id)
-        file_path = Path(glyph_record["file"])
-        if not file_path.exists():
-            raise FileNotFoundError(f"glyph matrix missing: {file_path}")
-
-        matrix = np.load(file_path)
-        spectrum = fft_encode(matrix)
-        recon = ifft_decode(spectrum)
-
-        mse = float(np.mean((matrix - recon) ** 2))
-        fft_mean = float(np.abs(np.fft.fftshift(np.fft.fft2(matrix))).mean())
+        matrix = self._load_matrix(glyph_record)
+        mse, fft_mean = _analyze_matrix(matrix)
 
         analysis = {
             "source": glyph_id,
@@ -82,6 +126,22 @@ class GlyphAgent:
     # Helpers                                                            #
     # ------------------------------------------------------------------ #
 
+    def _load_matrix(self, record: dict) -> np.ndarray:
+        key = record.get("key")
+        if key is not None and key in self._pending:
+            return self._pending[key]
+        file_path = Path(record["file"])
+        if not file_path.exists():
+            raise FileNotFoundError(f"glyph matrix missing: {file_path}")
+        if key is not None:
+            with np.load(file_path) as archive:
+                return archive[key]
+        # Legacy records point at a standalone .npy per glyph.
+        return np.load(file_path)
+
+    def _new_batch_path(self) -> Path:
+        return self.artifact_dir / f"glyphs_{uuid.uuid4().hex[:8]}.npz"
+
     @staticmethod
     def _new_glyph_id() -> str:
         return f"glyph_{uuid.uuid4().hex[:8]}"
@@ -121,19 +181,20 @@ def main(argv: list[str] | None = None) -> None:
     args = parser.parse_args(argv)
 
     state_path = Path(args.state)
-    adapter = BloomChainAdapter(state_path.parent / "chain.log")
+    adapter = adapter_for(state_path.parent / "chain.log")
     state = JsonStateStore(state_path, on_create=adapter.record_event)
     agent = GlyphAgent(state, artifact_dir=args.artifacts)
 
     if args.command == "gen":
         glyph_id, _ = agent.generate_glyph(args.token, size=args.size)
-        print(json.dumps({"glyph_id": glyph_id, "token": args.token, "size": args.size}))
+        agent.flush()
+        print(jsonio.dumps({"glyph_id": glyph_id, "token": args.token, "size": args.size}))
     elif args.command == "fft":
         analysis_id, metrics = agent.analyze_glyph_fft(args.glyph_id)
         metrics = {"analysis_id": analysis_id, **metrics}
-        print(json.dumps(metrics))
+        print(jsonio.dumps(metrics))
     elif args.command == "list":
-        print(json.dumps(agent.list_glyphs(), indent=2))
+        print(jsonio.dumps(agent.list_glyphs(), indent=True))
     else:
         parser.error("unknown command")
 
@@ -3,20 +3,20 @@
 from __future__ import annotations
 
 import argparse
-import json
 import uuid
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Tuple
 
-from agents.bloom_chain import BloomChainAdapter
+from agents import jsonio
+from agents.clock import utc_now
+from agents.bloom_chain import adapter_for
 from agents.state import JsonStateStore
 from src.lsb_encoder_decoder import LSBCodec
 from src.lsb_extractor import LSBExtractor
 
 
 def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return utc_now()
 
 
 class LSBAgent:
@@ -127,26 +127,26 @@ def main(argv: list[str] | None = None) -> None:
     args = parser.parse_args(argv)
 
     state_path = Path(args.state)
-    adapter = BloomChainAdapter(state_path.parent / "chain.log")
+    adapter = adapter_for(state_path.parent / "chain.log")
     state = JsonStateStore(state_path, on_create=adapter.record_event)
     agent = LSBAgent(state, artifact_dir=args.artifacts)
 
     if args.command == "cover":
         cover_id = agent.create_cover(args.width, args.height, args.out)
-        print(json.dumps({"cover_id": cover_id, "output": args.out or "auto"}))
+        print(jsonio.dumps({"cover_id": cover_id, "output": args.out or "auto"}))
     elif args.command == "embed":
         embed_id, output_path, info = agent.embed_message(args.cover, args.message, args.out, use_crc=not args.no_crc)
         payload = {"embed_id": embed_id, "output": output_path, "encoder_info": info}
-        print(json.dumps(payload))
+        print(jsonio.dumps(payload))
     elif args.command == "extract":
         extract_id, result = agent.extract_message(args.stego)
-        print(json.dumps({"extract_id": extract_id, "result": result}, indent=2))
+        print(jsonio.dumps({"extract_id": extract_id, "result": result}, indent=True))
     elif args.command == "list-covers":
-        print(json.dumps(state.list_section("lsb_covers"), indent=2))
+        print(jsonio.dumps(state.list_section("lsb_covers"), indent=True))
     elif args.command == "list-embeds":
-        print(json.dumps(state.list_section("lsb_embeds"), indent=2))
+        print(jsonio.dumps(state.list_section("lsb_embeds"), indent=True))
     elif args.command == "list-extracts":
-        print(json.dumps(state.list_section("lsb_extracts"), indent=2))
+        print(jsonio.dumps(state.list_section("lsb_extracts"), indent=True))
     else:
         parser.error("unknown command")
 
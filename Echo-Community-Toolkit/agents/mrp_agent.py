@@ -3,19 +3,20 @@
 from __future__ import annotations
 
 import argparse
-import json
 import uuid
-from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Tuple
 
-from agents.bloom_chain import BloomChainAdapter
+from agents import jsonio
+from agents.clock import utc_now
+from agents.bloom_chain import adapter_for
 from agents.state import JsonStateStore
 from src.mrp.codec import decode, encode
 
 
 def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    return utc_now()
 
 
 class MRPAgent:
@@ -109,10 +110,12 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=128)
 def _load_metadata(raw: str) -> Dict[str, object]:
+    """Parse the CLI metadata string, memoized for scripted repeat invocations."""
     try:
-        return json.loads(raw) if raw else {}
-    except json.JSONDecodeError as exc:
+        return jsonio.loads(raw) if raw else {}
+    except ValueError as exc:
         raise ValueError(f"Invalid metadata JSON: {exc}") from exc
 
 
@@ -121,22 +124,22 @@ def main(argv: list[str] | None = None) -> None:
     args = parser.parse_args(argv)
 
     state_path = Path(args.state)
-    adapter = BloomChainAdapter(state_path.parent / "chain.log")
+    adapter = adapter_for(state_path.parent / "chain.log")
     state = JsonStateStore(state_path, on_create=adapter.record_event)
     agent = MRPAgent(state, artifact_dir=args.artifacts)
 
     if args.command == "embed":
         metadata = _load_metadata(args.metadata)
         embed_id, out_path = agent.embed_message(args.cover, args.message, metadata, args.out)
-        print(json.dumps({"embed_id": embed_id, "output": out_path}))
+        print(jsonio.dumps({"embed_id": embed_id, "output": out_path}))
     elif args.command == "extract":
         extract_id, record, ecc = agent.extract_message(args.stego)
         payload = {"extract_id": extract_id, "message": record["message"], "metadata": record["metadata"], "ecc": ecc}
-        print(json.dumps(payload))
+        print(jsonio.dumps(payload))
     elif args.command == "list-embeds":
-        print(json.dumps(agent.list_embeds(), indent=2))
+        print(jsonio.dumps(agent.list_embeds(), indent=True))
     elif args.command == "list-extracts":
-        print(json.dumps(agent.list_extracts(), indent=2))
+        print(jsonio.dumps(agent.list_extracts(), indent=True))
     else:
         parser.error("unknown command")
 
@@ -7,10 +7,11 @@ import os
 import threading
 import uuid
 from copy import deepcopy
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Optional
 
+from agents.clock import utc_now
+
 STATE_FILE = Path("artifacts/state.json")
 
 LEDGER_SECTIONS: Dict[str, str] = {
@@ -174,7 +175,7 @@ def store() -> JsonStateStore:
 
 
 def _utc_timestamp() -> str:
-    return datetime.now(tz=timezone.utc).isoformat()
+    return utc_now()
 
 
 def add_entry(section: str, payload: Dict[str, Any], record_id: Optional[str] = None) -> str:
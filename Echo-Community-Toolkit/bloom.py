@@ -21,35 +21,53 @@ import subprocess
 import sys
 import shutil
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional
 
 
 ROOT = Path(__file__).resolve().parent
 ARTIFACTS = ROOT / "artifacts"
 
 
+@lru_cache(maxsize=8)
+def _parse_env_file_cached(path_str: str, mtime_ns: int) -> Mapping[str, str]:
+    """Parse and cache a dotenv file, keyed on path + mtime.
+
+    Env files are effectively immutable within a run, but every subcommand
+    rebuilds its environment; the mtime key invalidates the cache if the
+    file does change. Returns a read-only view so cached entries can't be
+    mutated by callers.
+    """
+    env: Dict[str, str] = {}
+    # Parse on bytes and decode only the key/value slices that survive the
+    # comment/blank filters; skips a full-file str copy up front.
+    for raw in Path(path_str).read_bytes().splitlines():
+        line = raw.strip()
+        if not line or line.startswith(b"#"):
+            continue
+        key, sep, value = line.partition(b"=")
+        if not sep:
+            continue
+        env[key.strip().decode("utf-8")] = value.strip().strip(b'"').decode("utf-8")
+    return MappingProxyType(env)
+
+
 def parse_env_file(path: Path) -> Dict[str, str]:
     """Parse a dotenv-style file into a dict."""
 
-    env: Dict[str, str] = {}
     if not path.exists():
         raise FileNotFoundError(f"Environment file not found: {path}")
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        env[key.strip()] = value.strip().strip('"')
-    return env
+    return dict(_parse_env_file_cached(str(path), path.stat().st_mtime_ns))
 
 
 def merged_env(env_file: Optional[Path]) -> Dict[str, str]:
     env = os.environ.copy()
     if env_file:
-        env.update(parse_env_file(env_file))
+        if not env_file.exists():
+            raise FileNotFoundError(f"Environment file not found: {env_file}")
+        env.update(_parse_env_file_cached(str(env_file), env_file.stat().st_mtime_ns))
     return env
 
 
@@ -130,62 +148,69 @@ def cmd_hold(args: argparse.Namespace) -> int:
     if args.skip_anchors:
         print("ℹ️  Anchor verification skipped by request")
 
-    if not args.skip_tests and args.scope in {"all", "backend"}:
-        try:
-            _run_pytest(env, args.dry_run)
-            results.append({"step": "pytest", "status": "passed"})
-        except subprocess.CalledProcessError as exc:
-            results.append({"step": "pytest", "status": "failed", "returncode": exc.returncode})
-            if not args.continue_on_error:
-                if args.report_json:
-                    _write_report(results)
-                return exc.returncode
-
-    if args.scope == "frontend":
-        try:
-            run(["npm", "run", "build"], env=env, dry_run=args.dry_run)
-            results.append({"step": "npm run build", "status": "passed"})
-        except subprocess.CalledProcessError as exc:
-            results.append({"step": "npm run build", "status": "failed", "returncode": exc.returncode})
-            if not args.continue_on_error:
-                if args.report_json:
-                    _write_report(results)
-                return exc.returncode
-    elif args.scope == "soulcode":
-        try:
-            run(["node", "tools/soulcode-bridge.js", "validate-bundle"], env=env, dry_run=args.dry_run)
-            results.append({"step": "soulcode validate-bundle", "status": "passed"})
-        except subprocess.CalledProcessError as exc:
-            results.append({"step": "soulcode validate-bundle", "status": "failed", "returncode": exc.returncode})
-            if not args.continue_on_error:
-                if args.report_json:
-                    _write_report(results)
-                return exc.returncode
-    else:
-        try:
-            proc = _run_final_validation(env, args.dry_run)
-            status = "passed" if proc.returncode == 0 else "failed"
-            results.append({"step": "final_validation", "status": status, "returncode": proc.returncode})
-            if status == "failed" and not args.continue_on_error:
-                if args.report_json:
-                    _write_report(results)
-                return proc.returncode
-        except subprocess.CalledProcessError as exc:
-            results.append({"step": "final_validation", "status": "failed", "returncode": exc.returncode})
-            if not args.continue_on_error:
-                if args.report_json:
-                    _write_report(results)
-                return exc.returncode
-
-    if args.report_json:
-        _write_report(results)
+    # The report is written exactly once in the finally block, so the
+    # early-return error paths below don't each repeat the write.
+    try:
+        if not args.skip_tests and args.scope in {"all", "backend"}:
+            try:
+                _run_pytest(env, args.dry_run)
+                results.append({"step": "pytest", "status": "passed"})
+            except subprocess.CalledProcessError as exc:
+                results.append({"step": "pytest", "status": "failed", "returncode": exc.returncode})
+                if not args.continue_on_error:
+                    return exc.returncode
+
+        if args.scope == "frontend":
+            try:
+                run(["npm", "run", "build"], env=env, dry_run=args.dry_run)
+                results.append({"step": "npm run build", "status": "passed"})
+            except subprocess.CalledProcessError as exc:
+                results.append({"step": "npm run build", "status": "failed", "returncode": exc.returncode})
+                if not args.continue_on_error:
+                    return exc.returncode
+        elif args.scope == "soulcode":
+            try:
+                run(["node", "tools/soulcode-bridge.js", "validate-bundle"], env=env, dry_run=args.dry_run)
+                results.append({"step": "soulcode validate-bundle", "status": "passed"})
+            except subprocess.CalledProcessError as exc:
+                results.append({"step": "soulcode validate-bundle", "status": "failed", "returncode": exc.returncode})
+                if not args.continue_on_error:
+                    return exc.returncode
+        else:
+            try:
+                proc = _run_final_validation(env, args.dry_run)
+                status = "passed" if proc.returncode == 0 else "failed"
+                results.append({"step": "final_validation", "status": status, "returncode": proc.returncode})
+                if status == "failed" and not args.continue_on_error:
+                    return proc.returncode
+            except subprocess.CalledProcessError as exc:
+                results.append({"step": "final_validation", "status": "failed", "returncode": exc.returncode})
+                if not args.continue_on_error:
+                    return exc.returncode
+    finally:
+        if args.report_json:
+            _write_report(results, pretty=args.pretty)
 
     print("✅ Hold complete")
     return 0
 
 
-def _write_report(results: List[Dict[str, object]]) -> None:
+def _dump_json(obj: object, *, pretty: bool = False) -> str:
+    # Reports are machine-consumed; compact output skips the indent
+    # formatting work and shrinks the artifact. --pretty opts back in.
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+@lru_cache(maxsize=1)
+def _ensure_artifacts() -> None:
+    # Cached so repeated report writes pay the directory stat only once.
     ARTIFACTS.mkdir(parents=True, exist_ok=True)
+
+
+def _write_report(results: List[Dict[str, object]], *, pretty: bool = False) -> None:
+    _ensure_artifacts()
     report_path = ARTIFACTS / "bloom_hold_report.json"
     payload = {
         "results": results,
@@ -194,10 +219,16 @@ def _write_report(results: List[Dict[str, object]]) -> None:
             "passed": sum(1 for r in results if r.get("status") == "passed"),
         },
     }
-    report_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    report_path.write_text(_dump_json(payload, pretty=pretty), encoding="utf-8")
     print(f"📝 Validation report written to {report_path}")
 
 
+@lru_cache(maxsize=1)
+def _gh_path() -> Optional[str]:
+    # which() stats every PATH entry; the answer doesn't change mid-run.
+    return shutil.which("gh")
+
+
 def cmd_exhale(args: argparse.Namespace) -> int:
     env_file = Path(args.env).resolve() if args.env else None
     env = merged_env(env_file)
@@ -225,7 +256,7 @@ def cmd_exhale(args: argparse.Namespace) -> int:
             run(["docker", "compose", "up", "-d"], env=env, dry_run=args.dry_run)
 
         if args.gh_action:
-            if shutil.which("gh") is None:
+            if _gh_path() is None:
                 print("⚠️  GitHub CLI not available; skipping workflow dispatch")
             else:
                 workflow = args.gh_action if isinstance(args.gh_action, str) else "monorepo-ci-enhanced.yml"
@@ -243,23 +274,28 @@ def fetch_status(env: Dict[str, str], *, dry_run: bool) -> None:
     run(["docker", "compose", "ps"], env=env, dry_run=dry_run)
 
 
-def generate_release_report(env: Dict[str, str], *, dry_run: bool) -> None:
-    ARTIFACTS.mkdir(parents=True, exist_ok=True)
+def generate_release_report(env: Dict[str, str], *, dry_run: bool, pretty: bool = False) -> None:
+    _ensure_artifacts()
     report_path = ARTIFACTS / "bloom_release_report.json"
     timestamp_utc = datetime.now(timezone.utc).isoformat()
     if dry_run:
         print(f"📝 (dry-run) would write release report to {report_path}")
         return
 
-    head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=str(ROOT), capture_output=True, text=True)
-    branch = subprocess.run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=str(ROOT), capture_output=True, text=True)
+    # One git invocation answers both questions: the first HEAD prints the
+    # commit, the second (after --abbrev-ref) prints the branch name.
+    out = subprocess.run(
+        ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
+        cwd=str(ROOT), capture_output=True, text=True,
+    ).stdout.splitlines()
+    commit, branch = (out + ["", ""])[:2]
     data = {
         "timestamp_utc": timestamp_utc,
-        "git_commit": head.stdout.strip(),
-        "git_branch": branch.stdout.strip(),
+        "git_commit": commit.strip(),
+        "git_branch": branch.strip(),
         "summary": "Spiral Bloom release report",
     }
-    report_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    report_path.write_text(_dump_json(data, pretty=pretty), encoding="utf-8")
     print(f"📝 Release report written to {report_path}")
 
 
@@ -269,12 +305,10 @@ def cleanup(env: Dict[str, str], *, dry_run: bool) -> None:
         if path.exists():
             print(f"🧹 Removing {path}")
             if not dry_run:
-                for child in path.glob("**/*"):
-                    if child.is_file():
-                        child.unlink()
-                for child in sorted(path.glob("**/*"), reverse=True):
-                    if child.is_dir():
-                        child.rmdir()
+                # One C-level recursive delete instead of two full glob
+                # walks; recreate the root so the directory persists empty.
+                shutil.rmtree(path, ignore_errors=True)
+                path.mkdir(parents=True, exist_ok=True)
 
 
 def cmd_release(args: argparse.Namespace) -> int:
@@ -290,7 +324,7 @@ def cmd_release(args: argparse.Namespace) -> int:
         fetch_status(env, dry_run=args.dry_run)
 
     if args.report:
-        generate_release_report(env, dry_run=args.dry_run)
+        generate_release_report(env, dry_run=args.dry_run, pretty=args.pretty)
 
     if args.cleanup:
         cleanup(env, dry_run=args.dry_run)
@@ -319,6 +353,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_hold.add_argument("--skip-tests", action="store_true", help="Skip unit tests")
     p_hold.add_argument("--skip-anchors", action="store_true", help="(Reserved) skip anchor checks")
     p_hold.add_argument("--report-json", action="store_true", help="Emit validation report JSON")
+    p_hold.add_argument("--pretty", action="store_true", help="Indent report JSON for human reading")
     p_hold.add_argument("--dry-run", action="store_true", help="Show actions without executing")
     p_hold.add_argument("--continue-on-error", action="store_true", help="Continue even if a step fails")
     p_hold.set_defaults(func=cmd_hold)
@@ -341,6 +376,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_release.add_argument("--logs", action="store_true", help="Fetch recent logs")
     p_release.add_argument("--status", action="store_true", help="Display deployment status")
     p_release.add_argument("--report", action="store_true", help="Generate release report JSON")
+    p_release.add_argument("--pretty", action="store_true", help="Indent report JSON for human reading")
     p_release.add_argument("--cleanup", action="store_true", help="Clean up temporary artifacts")
     p_release.add_argument("--dry-run", action="store_true", help="Show actions without executing")
     p_release.set_defaults(func=cmd_release)
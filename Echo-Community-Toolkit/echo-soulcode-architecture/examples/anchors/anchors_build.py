@@ -1,28 +1,52 @@
 # Build canonical Echo anchor JSON files deterministically.
 import subprocess, sys, json, hashlib, os
+from pathlib import Path
+
+try:
+    from agents.llm_agent import Phases, make_bundle, validate_bundle, save_json
+except ImportError:  # running as a script without the package installed
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+    from agents.llm_agent import Phases, make_bundle, validate_bundle, save_json
 
 def sha256_file(path: str) -> str:
-    import hashlib
-    h = hashlib.sha256()
+    # file_digest (3.11+) reads through a large C-level buffer instead of
+    # 8 KiB Python-loop chunks; fall back to one mmap-backed update.
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        import mmap
+        h = hashlib.sha256()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            h.update(mm)
+        return h.hexdigest()
 
-def run_anchor(out_path: str, alpha, beta, gamma, a_phase, b_phase, g_phase, timestamp, seed):
-    cmd = [
-        sys.executable, "-m", "echo_soulcode.live_read",
-        "--alpha", str(alpha), "--beta", str(beta), "--gamma", str(gamma),
-        "--alpha-phase", str(a_phase), "--beta-phase", str(b_phase), "--gamma-phase", str(g_phase),
-        "--timestamp", timestamp, "--seed", seed, "--out", out_path
-    ]
-    subprocess.check_call(cmd)
+def run_anchor(out_path: str, alpha, beta, gamma, a_phase, b_phase, g_phase, timestamp, seed,
+               use_subprocess: bool = False):
+    if use_subprocess:
+        # Isolation fallback: one interpreter per anchor, paying full
+        # import cost each time.
+        cmd = [
+            sys.executable, "-m", "echo_soulcode.live_read",
+            "--alpha", str(alpha), "--beta", str(beta), "--gamma", str(gamma),
+            "--alpha-phase", str(a_phase), "--beta-phase", str(b_phase), "--gamma-phase", str(g_phase),
+            "--timestamp", timestamp, "--seed", seed, "--out", out_path
+        ]
+        subprocess.check_call(cmd)
+        return
+    # In-process build: skips the fork/exec plus cold interpreter start
+    # (importing echo_soulcode + jsonschema dwarfs the actual work).
+    bundle = make_bundle(alpha, beta, gamma, Phases(a_phase, b_phase, g_phase), timestamp, seed)
+    validate_bundle(bundle)
+    save_json(bundle, Path(out_path), pretty=True)
 
 def main():
+    pretty = "--pretty" in sys.argv[1:]
+    use_subprocess = "--subprocess" in sys.argv[1:]
     os.makedirs("examples/anchors", exist_ok=True)
     # Anchor profile A (phi-phase baseline)
     out_a = "examples/anchors/echo_anchors_phiA.json"
-    run_anchor(out_a, 0.58, 0.39, 0.63, 0.0, 0.1, -0.2, "2025-10-12T00:00:00Z", "ANCHOR_V1")
+    run_anchor(out_a, 0.58, 0.39, 0.63, 0.0, 0.1, -0.2, "2025-10-12T00:00:00Z", "ANCHOR_V1",
+               use_subprocess=use_subprocess)
     h_a = sha256_file(out_a)
 
     manifest = {
@@ -39,8 +63,12 @@ def main():
             }
         ]
     }
+    # Compact by default; the manifest is consumed by tooling, not eyes.
     with open("examples/anchors/manifest.json", "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+        if pretty:
+            json.dump(manifest, f, indent=2)
+        else:
+            json.dump(manifest, f, separators=(",", ":"))
 
 if __name__ == "__main__":
     main()
@@ -60,9 +60,17 @@ def canonical_dump(obj: Any) -> str:
     """Stable JSON text for hashing & signing (UTF-8, sorted keys, minimal separators)."""
     return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
 
-def content_sha256(obj: Any) -> str:
-    """SHA-256 digest of the canonical JSON representation (hex)."""
-    return hashlib.sha256(canonical_dump(obj).encode('utf-8')).hexdigest()
+def canonical_bytes(obj: Any) -> bytes:
+    """Canonical form as UTF-8 bytes; serialize once when both text and hash are needed."""
+    return canonical_dump(obj).encode('utf-8')
+
+def content_sha256(obj: Any, canonical: bytes | None = None) -> str:
+    """SHA-256 digest of the canonical JSON representation (hex).
+
+    Pass ``canonical`` (from :func:`canonical_bytes`) to hash an
+    already-serialized form instead of re-serializing the object.
+    """
+    return hashlib.sha256(canonical if canonical is not None else canonical_bytes(obj)).hexdigest()
 
 def file_sha256(path: str) -> str:
     """SHA-256 of a file's bytes; returns sha256(no-sigil) if missing."""
@@ -2,11 +2,13 @@ import sys
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
-if str(REPO_ROOT) not in sys.path:
-    sys.path.insert(0, str(REPO_ROOT))
 
 # Ensure the architecture module's src directory remains importable when tests
-# are executed from within this subtree.
+# are executed from within this subtree. One set probe instead of a linear
+# sys.path scan per candidate.
 SRC_DIR = Path(__file__).resolve().parents[2] / 'src'
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
+_paths = set(sys.path)
+for _p in (str(REPO_ROOT), str(SRC_DIR)):
+    if _p not in _paths:
+        sys.path.insert(0, _p)
+        _paths.add(_p)
@@ -1,4 +1,6 @@
-from echo_soulcode.hilbert import normalize, HilbertState, phase_shift, dominant_frequency
+from echo_soulcode.hilbert import (normalize, HilbertState, phase_shift, dominant_frequency,
+                                   to_complex, normalize_batch, phase_shift_batch,
+                                   dominant_frequency_batch, to_complex_batch)
 
 def test_norm():
     a,b,g = normalize(0.58,0.39,0.63)
@@ -8,3 +10,16 @@ def test_phase_frequency():
     a,b,g = normalize(1,1,1)
     assert 0.0 <= dominant_frequency(b, g, f0=13.0) <= 13.0
     assert isinstance(phase_shift(a,b,g), float)
+
+def test_batch_matches_scalar():
+    abg = [(0.58,0.39,0.63), (1.0,1.0,1.0), (0.0,0.0,0.0)]
+    phases = [(0.0,0.1,-0.2), (0.0,0.0,0.0), (1.0,2.0,3.0)]
+    for row, want in zip(normalize_batch(abg), [normalize(*r) for r in abg]):
+        assert all(abs(x-y) < 1e-12 for x,y in zip(row, want))
+    for got, want in zip(phase_shift_batch(abg), [phase_shift(*r) for r in abg]):
+        assert abs(got - want) < 1e-12
+    for got, want in zip(dominant_frequency_batch(abg), [dominant_frequency(b,g) for _,b,g in abg]):
+        assert abs(got - want) < 1e-12
+    for row, want in zip(to_complex_batch(abg, phases),
+                         [to_complex(*m,*p) for m,p in zip(abg, phases)]):
+        assert all(abs(x-y) < 1e-12 for x,y in zip(row, want))
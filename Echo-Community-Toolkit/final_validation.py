@@ -11,9 +11,16 @@ Self-sufficient, order-agnostic runner:
 
 import sys
 import os
+import io
 import json
 import time
+import runpy
+import contextlib
+import collections
+import threading
+import traceback
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -22,20 +29,102 @@ SRC  = ROOT / "src"
 ASSETS_DATA = ROOT / "assets" / "data"
 ARTIFACTS = ROOT / "artifacts"
 
+class _TailBuffer(io.TextIOBase):
+    """Write sink that keeps only the most recent output lines.
+
+    The summary only ever prints the tail of each step's output, so
+    capturing a bounded ring of lines instead of the full stream keeps
+    memory flat however verbose a step gets.
+    """
+
+    def __init__(self, maxlines: int = 32):
+        self._lines = collections.deque(maxlen=maxlines)
+        self._partial = ""
+
+    def write(self, s: str) -> int:
+        self._partial += s
+        *full, self._partial = self._partial.split("\n")
+        self._lines.extend(full)
+        return len(s)
+
+    def getvalue(self) -> str:
+        parts = list(self._lines)
+        if self._partial:
+            parts.append(self._partial)
+        return "\n".join(parts)
+
+
 def run_py(label: str, path: Path, args=None, timeout=180) -> dict:
-    """Run a Python script with PYTHONPATH set to src; return dict with status & output."""
+    """Run a Python script and return a dict with status & output.
+
+    Scripts execute in-process via runpy (no fork/exec, no cold
+    interpreter start per step). Set FINAL_VALIDATION_SUBPROCESS=1 to get
+    the old one-interpreter-per-step isolation with timeout support.
+    """
     if not path.exists():
         return {"label": label, "present": False, "code": None, "ok": None, "stdout": "", "stderr": f"(missing) {path}"}
+    if os.environ.get("FINAL_VALIDATION_SUBPROCESS"):
+        return _run_py_subprocess(label, path, args, timeout)
+    out_buf, err_buf = _TailBuffer(), _TailBuffer()
+    old_argv, old_path, old_cwd = sys.argv, list(sys.path), os.getcwd()
+    code = 0
+    try:
+        sys.argv = [str(path)] + list(args or [])
+        if str(SRC) not in sys.path:
+            sys.path.insert(0, str(SRC))
+        os.chdir(ROOT)
+        with contextlib.redirect_stdout(out_buf), contextlib.redirect_stderr(err_buf):
+            try:
+                runpy.run_path(str(path), run_name="__main__")
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    code = e.code
+                elif e.code is not None:
+                    code = 1
+            except BaseException:
+                traceback.print_exc(file=err_buf)
+                code = 1
+    finally:
+        sys.argv = old_argv
+        sys.path[:] = old_path
+        os.chdir(old_cwd)
+    return {"label": label, "present": True, "code": code, "ok": code == 0,
+            "stdout": out_buf.getvalue(), "stderr": err_buf.getvalue()}
+
+def _run_py_subprocess(label: str, path: Path, args=None, timeout=180) -> dict:
+    """Isolation fallback: run the script in a fresh interpreter.
+
+    Output is drained into bounded tail buffers as it arrives, so a
+    verbose child can neither block on a full pipe nor balloon memory the
+    way capture_output=True does.
+    """
     env = os.environ.copy()
     env["PYTHONPATH"] = str(SRC) + os.pathsep + env.get("PYTHONPATH","")
     cmd = [sys.executable, str(path)] + list(args or [])
+    out_buf, err_buf = _TailBuffer(), _TailBuffer()
+
+    def _drain(stream, buf):
+        for line in stream:
+            buf.write(line)
+        stream.close()
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, cwd=str(ROOT), env=env)
+    readers = [threading.Thread(target=_drain, args=(proc.stdout, out_buf), daemon=True),
+               threading.Thread(target=_drain, args=(proc.stderr, err_buf), daemon=True)]
+    for t in readers:
+        t.start()
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, cwd=str(ROOT), env=env, timeout=timeout)
-        return {"label": label, "present": True, "code": proc.returncode, "ok": proc.returncode == 0,
-                "stdout": proc.stdout, "stderr": proc.stderr}
-    except subprocess.TimeoutExpired as e:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
         return {"label": label, "present": True, "code": None, "ok": False,
-                "stdout": e.stdout or "", "stderr": f"(timeout after {timeout}s) {e.stderr or ''}"}
+                "stdout": out_buf.getvalue(), "stderr": f"(timeout after {timeout}s) {err_buf.getvalue()}"}
+    for t in readers:
+        t.join()
+    return {"label": label, "present": True, "code": proc.returncode, "ok": proc.returncode == 0,
+            "stdout": out_buf.getvalue(), "stderr": err_buf.getvalue()}
 
 def ensure_golden_sample() -> dict:
     """Create/verify golden echo_key.png by running generate_golden_sample.py if available."""
@@ -105,20 +194,28 @@ def main() -> int:
 
     results = []
 
-    # Step 0 — Golden sample
+    # Step 0 — Golden sample (first: the LSB tests and demo read it)
     r_golden = ensure_golden_sample();   results.append(r_golden)
     print("🔍 Golden Sample...", "✅ PASS" if r_golden.get("ok") else "❌ FAIL")
 
+    # Steps 1-3 are independent of each other once the golden sample
+    # exists; run them in parallel worker processes.
+    with ProcessPoolExecutor(max_workers=3) as ex:
+        f_lsb = ex.submit(run_py, "tests/test_lsb.py", ROOT/"tests"/"test_lsb.py")
+        f_demo = ex.submit(run_py, "examples/demo.py", ROOT/"examples"/"demo.py")
+        f_build = ex.submit(ensure_mrp_payloads)
+        r_lsb, r_demo, r_build = f_lsb.result(), f_demo.result(), f_build.result()
+
     # Step 1 — LSB core tests
-    r_lsb = run_py("tests/test_lsb.py", ROOT/"tests"/"test_lsb.py");   results.append(r_lsb)
+    results.append(r_lsb)
     print("🔍 Core Test Suite...", "✅ PASS" if r_lsb.get("ok") else "❌ FAIL")
 
     # Step 2 — Demo (optional but recommended)
-    r_demo = run_py("examples/demo.py", ROOT/"examples"/"demo.py");    results.append(r_demo)
+    results.append(r_demo)
     print("🔍 Demo Script...", "✅ PASS" if r_demo.get("ok") else ("(skipped)" if r_demo.get("present") is False else "❌ FAIL"))
 
-    # Step 3 — Build/refresh MRP payloads if needed, then verify
-    r_build = ensure_mrp_payloads();     results.append(r_build)
+    # Step 3 — MRP payload build ran above; the verifier depends on it
+    results.append(r_build)
     print("🔍 MRP Payload Builder...", "✅ PASS" if r_build.get("ok") else ("(skipped)" if r_build.get("present") is False else "❌ FAIL"))
     r_mrp = run_mrp_verify();            results.append(r_mrp)
     print("🔍 MRP Verifier...", "✅ PASS" if r_mrp.get("ok") else "❌ FAIL")
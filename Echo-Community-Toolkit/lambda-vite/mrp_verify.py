@@ -13,59 +13,146 @@ Exit code: 0 on success, 1 on any check failing.
 """
 
 import argparse
-import base64
 import binascii
-import hashlib
+import functools
 import json
 import os
 import struct
 import sys
+import zlib
 from typing import Any, Dict, Tuple, Optional
 
+try:  # NumPy is optional here; the parity math falls back to pure python.
+    import numpy as np
+except ImportError:
+    np = None
+
+try:  # Optional C-extension JSON encoder; stdlib fallback keeps imports safe.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # Optional PCLMULQDQ-accelerated CRC32; zlib is the portable fallback.
+    from fastcrc.crc32 import iso_hdlc as _crc32_fast
+except ImportError:
+    _crc32_fast = None
+
+PNG_SIG = b"\x89PNG\r\n\x1a\n"
+
+# Precompiled once; unpack_from skips per-call format parsing.
+_IHDR_WH = struct.Struct(">II")
+
 HEADER_LEN_WITH_CRC = 14  # magic(4)+channel(1)+flags(1)+length(4)+crc32(4)
 
 
 def load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def crc32_hex(data: bytes) -> str:
-    # zlib.crc32 returns signed in some envs; mask to 32-bit
-    import zlib
-    return format(zlib.crc32(data) & 0xFFFFFFFF, "08X")
+    # fastcrc (when installed) folds 64 bytes per iteration with
+    # carry-less multiplies; iso_hdlc is the same CRC-32 zlib computes.
+    if _crc32_fast is not None:
+        return format(_crc32_fast(data), "08X")
+    # zlib.crc32 returns signed in some envs; mask to 32-bit.
+    # memoryview avoids copying when callers pass slices.
+    return format(zlib.crc32(memoryview(data)) & 0xFFFFFFFF, "08X")
 
 
 def minify_json_bytes(obj: Any) -> bytes:
-    """Stable, ascii-preserving minify used for base64 body generation."""
-    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    """Stable, ascii-preserving minify used for base64 body generation.
+
+    Key order is deliberately preserved (not sorted): the seed package's
+    expected CRC/SHA/parity values were generated from insertion-order
+    minified bytes. Both encoders emit identical bytes for these payloads,
+    so hashes agree with or without orjson.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # ensure_ascii=True (the default) keeps CPython's C encoder on its
+    # ASCII fast path. A "\\u" sequence in the result means something
+    # was escaped (or a literal backslash-u exists), so re-encode with
+    # ensure_ascii=False to match orjson's raw UTF-8 bytes; otherwise
+    # the two encodings are byte-identical.
+    text = json.dumps(obj, separators=(",", ":"))
+    if "\\u" in text:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return text.encode("ascii")
+
+
+@functools.lru_cache(maxsize=64)
+def _load_payload_cached(path: str, mtime_ns: int) -> Tuple[Any, bytes]:
+    # One binary read; json.loads accepts UTF-8 bytes directly, skipping
+    # the text-mode decode pass.
+    with open(path, "rb") as f:
+        raw = f.read()
+    obj = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    minified = minify_json_bytes(obj)
+    # Producers normally write the canonical minified form already; hash
+    # the on-disk buffer in that case instead of keeping a second copy.
+    return obj, raw if raw == minified else minified
+
+
+def load_payload(path: str) -> Tuple[Any, bytes]:
+    """(object, minified canonical bytes) for a payload JSON.
+
+    Cached per (path, mtime), so repeat verifications in one process
+    (watch mode, batch mode) skip the JSON parse and re-serialize for
+    unchanged files. Callers must treat the object as read-only.
+    """
+    return _load_payload_cached(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _png_dims_cached(path: str, mtime_ns: int) -> Optional[Tuple[int, int]]:
+    with open(path, "rb") as f:
+        # Signature + IHDR length/type/width/height fit in 24 bytes;
+        # one read instead of four.
+        buf = f.read(24)
+    if len(buf) < 24 or buf[:8] != PNG_SIG or buf[12:16] != b"IHDR":
+        return None
+    return _IHDR_WH.unpack_from(buf, 16)
 
 
 def compute_png_dims(path: str) -> Optional[Tuple[int, int]]:
     """
     Read PNG width/height from header without external deps.
     Returns (width, height) or None if not PNG / malformed.
+    Cached per (path, mtime) so repeat verifications skip the I/O.
     """
+
     try:
-        with open(path, "rb") as f:
-            sig = f.read(8)
-            if sig != b"\x89PNG\r\n\x1a\n":
-                return None
-            # Next comes IHDR chunk: length(4) 'IHDR'(4) then data
-            ihdr_len = struct.unpack(">I", f.read(4))[0]
-            ihdr_type = f.read(4)
-            if ihdr_type != b"IHDR":
-                return None
-            ihdr = f.read(ihdr_len)
-            if len(ihdr) < 8:
-                return None
-            width = struct.unpack(">I", ihdr[0:4])[0]
-            height = struct.unpack(">I", ihdr[4:8])[0]
-            return width, height
-    except Exception:
+        return _png_dims_cached(path, os.stat(path).st_mtime_ns)
+    except OSError:
         return None
 
 
+_B64_CHUNK = 57 * 1024  # multiple of 3, so per-chunk b64 concatenates cleanly
+
+
+def _b64_sha_crc(data: bytes) -> Tuple[bytes, str, str]:
+    """Base64-encode while computing SHA-256 and CRC32 in one pass.
+
+    Each chunk of the b64 form is fed to both digests while still
+    cache-hot instead of making three separate full passes over it;
+    returns (b64_bytes, sha256_hex, crc32_hex).
+    """
+    import hashlib
+
+    h = hashlib.new("sha256", usedforsecurity=False)
+    crc = 0
+    out = bytearray()
+    mv = memoryview(data)
+    for i in range(0, len(data), _B64_CHUNK):
+        b64 = binascii.b2a_base64(mv[i : i + _B64_CHUNK], newline=False)
+        h.update(b64)
+        crc = zlib.crc32(b64, crc)
+        out += b64
+    return bytes(out), h.hexdigest(), format(crc & 0xFFFFFFFF, "08X")
+
+
 def compute_phase_a_parity_b64(r_b64: bytes, g_b64: bytes) -> str:
     """
     Phase‑A parity (as used by the seed package):
@@ -76,31 +163,88 @@ def compute_phase_a_parity_b64(r_b64: bytes, g_b64: bytes) -> str:
     """
     Lg = len(g_b64)
     Lr = len(r_b64)
-    P = bytearray(Lg)
-    for i in range(Lg):
-        if i < Lr:
-            P[i] = r_b64[i] ^ g_b64[i]
-        else:
-            P[i] = g_b64[i]
-    return base64.b64encode(bytes(P)).decode("ascii")
-
-
-def verify(args) -> Dict[str, Any]:
-    # Load payloads
-    R_obj = load_json(args.R)
-    G_obj = load_json(args.G)
-    B_obj = load_json(args.B)
-
-    # Minify and wrap in base64 (canonical form used on-wire)
-    R_min = minify_json_bytes(R_obj)
-    G_min = minify_json_bytes(G_obj)
-    R_b64 = base64.b64encode(R_min)
-    G_b64 = base64.b64encode(G_min)
-
-    # Recompute hashes
-    crc_r = crc32_hex(R_b64)
+    n = min(Lr, Lg)
+    if np is not None:
+        # One vectorized XOR over the overlapping prefix instead of a
+        # per-byte Python loop; the G tail passes through unchanged.
+        g = np.frombuffer(g_b64, dtype=np.uint8)
+        r = np.frombuffer(r_b64, dtype=np.uint8)
+        out = g.copy()
+        np.bitwise_xor(r[:n], g[:n], out=out[:n])
+        return binascii.b2a_base64(out, newline=False).decode("ascii")
+    # Pure-python fallback: one bignum XOR in C instead of a byte loop.
+    if n:
+        xored = (int.from_bytes(r_b64[:n], "big") ^ int.from_bytes(g_b64[:n], "big")).to_bytes(n, "big")
+    else:
+        xored = b""
+    return binascii.b2a_base64(xored + g_b64[n:], newline=False).decode("ascii")
+
+
+def _parity_batch_b64(pairs) -> list:
+    """Phase‑A parity for N (R_b64, G_b64) pairs as one padded XOR kernel.
+
+    Rows are packed structure-of-arrays into [N, Lmax] uint8 matrices
+    (zero padded); a single vectorized XOR then yields every parity
+    block, and each row is truncated back to its own G length. Requires
+    numpy; callers fall back to the scalar helper without it.
+    """
+    lens_g = [len(g) for _, g in pairs]
+    Lmax = max(lens_g, default=0)
+    R_mat = np.zeros((len(pairs), Lmax), dtype=np.uint8)
+    G_mat = np.zeros((len(pairs), Lmax), dtype=np.uint8)
+    for i, (r, g) in enumerate(pairs):
+        n = min(len(r), len(g))
+        R_mat[i, :n] = np.frombuffer(r[:n], dtype=np.uint8)
+        G_mat[i, : len(g)] = np.frombuffer(g, dtype=np.uint8)
+    # Zero padding makes R^G collapse to the G tail passthrough for free.
+    P = R_mat ^ G_mat
+    return [
+        binascii.b2a_base64(P[i, : lens_g[i]], newline=False).decode("ascii")
+        for i in range(len(pairs))
+    ]
+
+
+def verify_batch(arg_list) -> list:
+    """Verify N payload sets in one call (batch/CI mode).
+
+    With numpy available the parity recompute — the only O(N·L) Python
+    work in the scalar path — is hoisted into one SoA kernel over all
+    rows; CRC/SHA stay per-row since those already run at C speed.
+    """
+    if np is None or len(arg_list) < 2:
+        return [verify(a) for a in arg_list]
+    pairs = [
+        (
+            binascii.b2a_base64(load_payload(a.R)[1], newline=False),
+            binascii.b2a_base64(load_payload(a.G)[1], newline=False),
+        )
+        for a in arg_list
+    ]
+    parities = _parity_batch_b64(pairs)
+    return [verify(a, _precomputed_parity=p) for a, p in zip(arg_list, parities)]
+
+
+def verify(args, _precomputed_parity: Optional[str] = None) -> Dict[str, Any]:
+    # Load payloads (cached per path+mtime; canonical form used on-wire)
+    R_obj, R_min = load_payload(args.R)
+    G_obj, G_min = load_payload(args.G)
+    B_obj, _ = load_payload(args.B)
+
+    # R: encode + SHA-256 + CRC32 in one fused pass over the b64 form.
+    # (usedforsecurity=False inside lets OpenSSL pick its accelerated
+    # implementation; this digest is an integrity check, not a security
+    # boundary.) G only needs its CRC, so it takes the plain path.
+    # With --fail-fast the CRCs come first so a mismatch can skip the
+    # SHA and parity work entirely.
+    fail_fast = bool(getattr(args, "fail_fast", False))
+    sha_r_b64 = calc_par_b64 = None
+    if fail_fast:
+        R_b64 = binascii.b2a_base64(R_min, newline=False)
+        crc_r = crc32_hex(R_b64)
+    else:
+        R_b64, sha_r_b64, crc_r = _b64_sha_crc(R_min)
+    G_b64 = binascii.b2a_base64(G_min, newline=False)
     crc_g = crc32_hex(G_b64)
-    sha_r_b64 = hashlib.sha256(R_b64).hexdigest()
 
     # Expected from B-payload
     exp_crc_r = B_obj.get("crc_r")
@@ -109,20 +253,31 @@ def verify(args) -> Dict[str, Any]:
     exp_par_b64 = B_obj.get("parity_block_b64")
     ecc_scheme = B_obj.get("ecc_scheme")
 
-    # Parity recompute (Phase‑A only)
-    calc_par_b64 = compute_phase_a_parity_b64(R_b64, G_b64)
+    short_circuited = fail_fast and not (crc_r == exp_crc_r and crc_g == exp_crc_g)
+    if not short_circuited:
+        if sha_r_b64 is None:
+            import hashlib
+
+            h = hashlib.new("sha256", usedforsecurity=False)
+            h.update(memoryview(R_b64))
+            sha_r_b64 = h.hexdigest()
+        # Parity recompute (Phase‑A only); batch mode supplies it precomputed
+        if _precomputed_parity is not None:
+            calc_par_b64 = _precomputed_parity
+        else:
+            calc_par_b64 = compute_phase_a_parity_b64(R_b64, G_b64)
 
     checks = {
         "crc_r_ok": (crc_r == exp_crc_r),
         "crc_g_ok": (crc_g == exp_crc_g),
-        "sha256_r_b64_ok": (sha_r_b64 == exp_sha),
+        "sha256_r_b64_ok": None if short_circuited else (sha_r_b64 == exp_sha),
         "ecc_scheme_ok": (ecc_scheme in ("parity", "PARITY")),
-        "parity_block_ok": (calc_par_b64 == exp_par_b64),
+        "parity_block_ok": None if short_circuited else (calc_par_b64 == exp_par_b64),
     }
 
-    # Sidecar checks (optional)
+    # Sidecar checks (optional; skipped once fail-fast has tripped)
     sidecar_info = None
-    if args.sidecar and os.path.exists(args.sidecar):
+    if args.sidecar and os.path.exists(args.sidecar) and not short_circuited:
         S = load_json(args.sidecar)
         sidecar_info = S
 
@@ -204,7 +359,8 @@ def verify(args) -> Dict[str, Any]:
             "crc_r": crc_r,
             "crc_g": crc_g,
             "sha256_r_b64": sha_r_b64,
-            "parity_b64_head": calc_par_b64[:64] + ("..." if len(calc_par_b64) > 64 else ""),
+            "parity_b64_head": None if calc_par_b64 is None else
+                calc_par_b64[:64] + ("..." if len(calc_par_b64) > 64 else ""),
         },
         "expected_from_B": {
             "crc_r": exp_crc_r,
@@ -238,6 +394,8 @@ def main():
     ap.add_argument("--B", dest="B", default="mrp_lambda_B_payload.json", help="Path to B payload JSON.")
     ap.add_argument("--sidecar", dest="sidecar", default="mrp_lambda_state_sidecar.json", help="Path to sidecar JSON (optional).")
     ap.add_argument("--json", dest="json_out", default="", help="If set, write full report JSON to this path.")
+    ap.add_argument("--fail-fast", dest="fail_fast", action="store_true",
+                    help="Stop after a CRC mismatch, skipping SHA/parity/sidecar work (CI mode).")
     args = ap.parse_args()
 
     try:
@@ -268,8 +426,16 @@ def main():
 
     if args.json_out:
         try:
-            with open(args.json_out, "w", encoding="utf-8") as f:
-                json.dump(report, f, ensure_ascii=False, indent=2)
+            # Encode once and write the bytes with a single syscall.
+            if orjson is not None:
+                buf = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+            else:
+                buf = json.dumps(report, ensure_ascii=False, indent=2).encode("utf-8")
+            fd = os.open(args.json_out, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, buf)
+            finally:
+                os.close(fd)
             print(f"[saved] {args.json_out}")
         except Exception as e:
             print(f"[WARN] Could not write JSON report: {e}", file=sys.stderr)
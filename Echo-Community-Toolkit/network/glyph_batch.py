@@ -12,21 +12,33 @@ registration).
 from __future__ import annotations
 
 import base64
+import functools
 import io
 import math
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Iterable, List, Optional, Sequence
+from typing import Callable, Iterable, List, Optional, Sequence
 
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
-from src.g2v.volume import glyph_from_tink_token, angular_projection, build_volume_stack
-from src.g2v.fft_codec import fft_encode, ifft_decode
+from src.g2v.volume import glyph_from_tink_token, angular_projection
+from src.g2v.fft_codec import FFT_KW, fft2, ifft2, rfft2
+
+try:  # Optional SSSE3/AVX2 base64 codec; stdlib is the portable fallback.
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+_b64encode = pybase64.b64encode if pybase64 is not None else base64.b64encode
 
 
 def _normalise(array: np.ndarray) -> np.ndarray:
-    """Scale array into the [0, 1] range."""
-    array = np.asarray(array, float)
+    """Scale array into the [0, 1] range (float32 working precision)."""
+    array = np.asarray(array, np.float32)
     if array.size == 0:
         return np.zeros_like(array)
     mn = float(array.min())
@@ -37,12 +49,72 @@ def _normalise(array: np.ndarray) -> np.ndarray:
     return (array - mn) / rng
 
 
+def _normalise_batch(stack: np.ndarray) -> np.ndarray:
+    """Scale each glyph of an (N, H, W) stack into [0, 1].
+
+    Three vectorized reductions replace N scalar ``_normalise`` calls;
+    constant glyphs collapse to zeros, matching the scalar helper.
+    """
+    # float32 halves bandwidth through the FFT/normalize stages and is
+    # ample for glyphs quantized to 8 bits at output.
+    stack = np.asarray(stack, np.float32)
+    mn = stack.min(axis=(-2, -1), keepdims=True)
+    rng = stack.max(axis=(-2, -1), keepdims=True) - mn
+    return (stack - mn) / np.where(rng == 0.0, 1.0, rng)
+
+
+_PNG_SIG = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return (struct.pack(">I", len(data)) + chunk_type + data
+            + struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+
+@functools.lru_cache(maxsize=8)
+def _png_ihdr_l8(width: int, height: int) -> bytes:
+    # 8-bit greyscale, no interlace; glyph batches share one size, so the
+    # header chunk is computed once per (w, h).
+    return _png_chunk(b"IHDR", struct.pack(">II5B", width, height, 8, 0, 0, 0, 0))
+
+
+def _encode_png_l8(pixels: np.ndarray) -> bytes:
+    """Minimal greyscale PNG encoder for tiny glyph images.
+
+    Skips PIL's generic save machinery: filter byte 0 per row, one IDAT
+    with fast deflate, fixed IHDR. Decoders see an ordinary 8-bit L PNG.
+    """
+    height, width = pixels.shape
+    rows = np.empty((height, width + 1), dtype=np.uint8)
+    rows[:, 0] = 0  # filter type None for every scanline
+    rows[:, 1:] = pixels
+    idat = zlib.compress(rows.tobytes(), 1)
+    return (_PNG_SIG + _png_ihdr_l8(width, height)
+            + _png_chunk(b"IDAT", idat) + _png_chunk(b"IEND", b""))
+
+
 def _to_base64_png(array: np.ndarray) -> str:
     """Convert a normalised glyph array to a base64-encoded PNG string."""
-    img = Image.fromarray(np.uint8(np.clip(array, 0, 1) * 255), mode="L")
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    return base64.b64encode(buf.getvalue()).decode("ascii")
+    pixels = np.uint8(np.clip(array, 0, 1) * 255)
+    return _b64encode(_encode_png_l8(pixels)).decode("ascii")
+
+
+_PNG_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _encode_batch_png(glyphs: Sequence[np.ndarray]) -> List[str]:
+    """PNG-encode a batch of glyphs, in parallel when it pays off.
+
+    PIL's save path and zlib release the GIL, so threads overlap the
+    deflate work across cores; tiny batches stay sequential to skip the
+    pool dispatch overhead.
+    """
+    global _PNG_POOL
+    if len(glyphs) < 4:
+        return [_to_base64_png(g) for g in glyphs]
+    if _PNG_POOL is None:
+        _PNG_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return list(_PNG_POOL.map(_to_base64_png, glyphs))
 
 
 @dataclass
@@ -63,11 +135,23 @@ class GlyphBatchProcessor:
     size: int = 64
     projection: bool = True
     theta_deg: float = 30.0
-
-    glyphs: List[np.ndarray] = field(default_factory=list)
+    # Optional spectral filter applied between the batched FFT and its
+    # inverse; when None the round-trip is skipped entirely (it is a
+    # numeric identity and only cost O(N^2 log N) per glyph).
+    fft_filter: Optional[Callable[[np.ndarray], np.ndarray]] = None
+
+    # Glyphs live in one contiguous (N, size, size) float32 array rather
+    # than a list of independent 2-D arrays: downstream normalisation,
+    # FFT, and encoding steps become single vector ops over the batch.
+    glyphs_arr: Optional[np.ndarray] = None
     tokens: List[str] = field(default_factory=list)
     fft_metadata: Optional[List[float]] = None
 
+    @property
+    def glyphs(self) -> List[np.ndarray]:
+        """Per-glyph 2-D views into the batch array (compatibility accessor)."""
+        return [] if self.glyphs_arr is None else list(self.glyphs_arr)
+
     # ------------------------------------------------------------------ #
     # Core processing steps                                              #
     # ------------------------------------------------------------------ #
@@ -77,55 +161,84 @@ class GlyphBatchProcessor:
         Generate glyph arrays from symbolic tokens.
 
         Each glyph is normalised, optionally projected through a stacked
-        volume, enhanced via an FFT round-trip, and re-normalised into [0, 1].
+        volume and, when ``fft_filter`` is set, passed through a spectral
+        filter via a batched FFT round-trip and re-normalised into [0, 1].
         """
         self.tokens = list(token_list)
-        self.glyphs = []
-
-        for token in self.tokens:
-            glyph = glyph_from_tink_token(token, self.size)
-            glyph = _normalise(glyph)
+        self.glyphs_arr = None
 
-            if self.projection:
-                volume = build_volume_stack([glyph, np.rot90(glyph)])
-                glyph = angular_projection(volume, theta_deg=self.theta_deg)
-                glyph = _normalise(glyph)
-
-            spectrum = fft_encode(glyph)
-            glyph_rt = ifft_decode(spectrum)
-            glyph_rt = _normalise(glyph_rt)
-            self.glyphs.append(glyph_rt)
+        if not self.tokens:
+            return False
 
-        return bool(self.glyphs)
+        # Fill the batch array row by row instead of stacking a temporary
+        # list of per-token arrays.
+        raw = np.empty((len(self.tokens), self.size, self.size), np.float32)
+        for idx, token in enumerate(self.tokens):
+            raw[idx] = glyph_from_tink_token(token, self.size)
+        stack = _normalise_batch(raw)
+
+        if self.projection:
+            # One (H, W, 2) volume buffer reused across tokens instead of a
+            # fresh build_volume_stack allocation per glyph; np.rot90 stays
+            # a zero-copy view of the source glyph.
+            vol = np.empty((self.size, self.size, 2), dtype=np.float32)
+            projected = []
+            for g in stack:
+                vol[..., 0] = g
+                vol[..., 1] = np.rot90(g)
+                projected.append(angular_projection(vol, theta_deg=self.theta_deg))
+            stack = _normalise_batch(np.stack(projected))
+
+        if self.fft_filter is not None:
+            # One batched FFT over the whole stack instead of a transform
+            # pair per glyph; the shift/unshift in the scalar codec cancels
+            # on a round-trip, so it is dropped here.
+            spectra = self.fft_filter(fft2(stack, axes=(-2, -1), **FFT_KW))
+            stack = _normalise_batch(np.real(ifft2(spectra, axes=(-2, -1), **FFT_KW)))
+
+        self.glyphs_arr = np.ascontiguousarray(stack)
+
+        return self.glyphs_arr.size > 0
 
     def apply_batch_normalization(self) -> bool:
         """
         Normalise each glyph to a consistent mean brightness.
         """
-        if not self.glyphs:
+        if self.glyphs_arr is None or self.glyphs_arr.size == 0:
             return False
 
         target_mean = 0.5
-        for idx, glyph in enumerate(self.glyphs):
-            glyph = _normalise(glyph)
-            mean_val = float(glyph.mean()) if glyph.size else 0.0
-            if mean_val > 0:
-                glyph = np.clip(glyph * (target_mean / mean_val), 0, 1)
-            self.glyphs[idx] = glyph
+        # One vectorised pass over the batch: constant glyphs collapse to
+        # zeros in _normalise_batch, so their mean of 0 is left untouched
+        # (multiplying zeros by any scale keeps them zero).
+        stack = _normalise_batch(self.glyphs_arr)
+        means = stack.mean(axis=(-2, -1), keepdims=True)
+        stack *= target_mean / np.where(means == 0.0, 1.0, means)
+        np.clip(stack, 0, 1, out=stack)
+        self.glyphs_arr = stack
         return True
 
     def compute_fft_metadata(self) -> Optional[List[float]]:
         """
         Compute mean magnitude of the FFT spectrum for each glyph.
         """
-        if not self.glyphs:
+        if self.glyphs_arr is None or self.glyphs_arr.size == 0:
             self.fft_metadata = None
             return None
 
-        fft_means: List[float] = []
-        for glyph in self.glyphs:
-            spectrum = np.fft.fftshift(np.fft.fft2(glyph))
-            fft_means.append(float(np.abs(spectrum).mean()))
+        # Glyphs are real, so rfft2 computes only the non-redundant half
+        # spectrum (~2x less work). The full-spectrum magnitude mean is
+        # recovered exactly from Hermitian symmetry: interior columns
+        # appear twice, the DC column once, and for even widths the
+        # Nyquist column once. (fftshift is a permutation and cannot
+        # change the mean.)
+        stack = self.glyphs_arr
+        height, width = stack.shape[-2:]
+        mag = np.abs(rfft2(stack, axes=(-2, -1), **FFT_KW))
+        total = 2.0 * mag.sum(axis=(-2, -1)) - mag[..., 0].sum(axis=-1)
+        if width % 2 == 0:
+            total -= mag[..., -1].sum(axis=-1)
+        fft_means = [float(m) for m in total / (height * width)]
 
         self.fft_metadata = fft_means
         return fft_means
@@ -134,19 +247,26 @@ class GlyphBatchProcessor:
         """
         Compose glyphs into an approximately sqrt(N) × sqrt(N) collage.
         """
-        if not self.glyphs:
+        if self.glyphs_arr is None or self.glyphs_arr.size == 0:
             return None
 
-        n = len(self.glyphs)
+        n = len(self.glyphs_arr)
         cols = max(1, math.ceil(math.sqrt(n)))
         rows = max(1, math.ceil(n / cols))
-        canvas = Image.new("L", (self.size * cols, self.size * rows), 0)
 
-        for idx, glyph in enumerate(self.glyphs):
-            x = (idx % cols) * self.size
-            y = (idx // cols) * self.size
-            img = Image.fromarray(np.uint8(np.clip(glyph, 0, 1) * 255), mode="L")
-            canvas.paste(img, (x, y))
+        # Build the whole mosaic in NumPy — pad to a full grid, fold the
+        # batch axis into (rows, cols) tiles, and interleave tile rows via
+        # transpose — then hand PIL one finished array instead of pasting
+        # N separate images.
+        tiles = self.glyphs_arr
+        pad = rows * cols - n
+        if pad:
+            tiles = np.concatenate(
+                [tiles, np.zeros((pad, self.size, self.size), np.float32)])
+        grid = (tiles.reshape(rows, cols, self.size, self.size)
+                .transpose(0, 2, 1, 3)
+                .reshape(rows * self.size, cols * self.size))
+        canvas = Image.fromarray(np.uint8(np.clip(grid, 0, 1) * 255), mode="L")
 
         if include_labels:
             draw = ImageDraw.Draw(canvas)
@@ -162,29 +282,30 @@ class GlyphBatchProcessor:
         """
         Return glyphs as a sequential array (optionally base64 encoded).
         """
-        if not self.glyphs:
+        if self.glyphs_arr is None or self.glyphs_arr.size == 0:
             return []
 
         if as_base64:
-            return [_to_base64_png(glyph) for glyph in self.glyphs]
-        return [np.array(glyph, copy=True) for glyph in self.glyphs]
+            return _encode_batch_png(self.glyphs_arr)
+        return [np.array(glyph, copy=True) for glyph in self.glyphs_arr]
 
     def create_manifest(self) -> List[dict]:
         """
         Produce manifest entries combining tokens, FFT stats, and imagery.
         """
-        if not self.glyphs:
+        if self.glyphs_arr is None or self.glyphs_arr.size == 0:
             return []
 
         if self.fft_metadata is None:
             self.compute_fft_metadata()
 
+        encoded = _encode_batch_png(self.glyphs_arr)
         manifest: List[dict] = []
         for idx, token in enumerate(self.tokens):
             entry = {
                 "token": token,
                 "fft_mean": float(self.fft_metadata[idx]) if self.fft_metadata else None,
-                "base64": _to_base64_png(self.glyphs[idx]),
+                "base64": encoded[idx],
             }
             manifest.append(entry)
         return manifest
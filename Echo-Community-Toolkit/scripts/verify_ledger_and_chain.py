@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import argparse
+import base64
 import hashlib
 import json
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+def _dumps_canonical(payload: Dict[str, Any]) -> bytes:
+    # Mirror agents.bloom_chain: always stdlib json for hash input --
+    # orjson formats float exponents differently (1e28 vs 1e+28), which
+    # would silently change block hashes between environments.
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 
 def _read_chain(chain_path: Path) -> List[Dict[str, Any]]:
     blocks: List[Dict[str, Any]] = []
@@ -23,8 +30,11 @@ def _read_chain(chain_path: Path) -> List[Dict[str, Any]]:
 
 
 def _rehash_block(index: int, prev_hash: str, payload: Dict[str, Any]) -> str:
-    content = f"{index}|{prev_hash}|{json.dumps(payload, sort_keys=True)}".encode("utf-8")
-    return hashlib.sha256(content).hexdigest()
+    # Hashes are computed over raw digest bytes but stored base64-encoded
+    # (the genesis sentinel is stored literally); mirror agents.bloom_chain.
+    prev_bytes = b"GENESIS" if prev_hash == "GENESIS" else base64.b64decode(prev_hash)
+    content = b"%d|%s|%s" % (index, prev_bytes, _dumps_canonical(payload))
+    return base64.b64encode(hashlib.sha256(content).digest()).decode("ascii")
 
 
 def verify(state_path: Path, chain_path: Path) -> Dict[str, Any]:
@@ -1,8 +1,17 @@
 import numpy as np
 
+try:
+    # scipy's pocketfft can split work across threads via workers=-1; numpy's
+    # transforms are single-threaded. Fall back so the module stays importable
+    # with numpy alone.
+    from scipy.fft import fft2, fftshift, ifft2, ifftshift, rfft2
+    FFT_KW = {"workers": -1}
+except ImportError:  # pragma: no cover - exercised only without scipy
+    from numpy.fft import fft2, fftshift, ifft2, ifftshift, rfft2
+    FFT_KW = {}
+
 def fft_encode(img):
-    return np.fft.fftshift(np.fft.fft2(np.asarray(img, float)))
+    return fftshift(fft2(np.asarray(img, float), **FFT_KW))
 
 def ifft_decode(F):
-    return np.real(np.fft.ifft2(np.fft.ifftshift(np.asarray(F))))
-
+    return np.real(ifft2(ifftshift(np.asarray(F)), **FFT_KW))
@@ -1,14 +1,17 @@
+import hashlib
 import json
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure project root is on sys.path for direct 'agents.*' imports
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from agents.state import JsonStateStore
-from agents.bloom_chain import BloomChainAdapter
+from agents.bloom_chain import GENESIS, BloomChainAdapter, _dumps_canonical
 
 
 def read_chain(chain_path: Path):
@@ -30,6 +33,7 @@ def test_create_appends_block_and_backrefs(tmp_path: Path):
     # Create first record in 'glyphs'
     rec1_id = store.create_record("glyphs", {"token": "I-Glyph", "size": 32})
     rec1 = store.get_record("glyphs", rec1_id)
+    adapter.flush()
     chain = read_chain(chain_path)
 
     assert "block_hash" in rec1 and isinstance(rec1["block_hash"], str)
@@ -42,6 +46,7 @@ def test_create_appends_block_and_backrefs(tmp_path: Path):
     # Create second record in another section; chain should link by prev_hash
     rec2_id = store.create_record("mrp_embeds", {"cover": "cover.png", "message": "Hello"})
     rec2 = store.get_record("mrp_embeds", rec2_id)
+    adapter.flush()
     chain = read_chain(chain_path)
 
     assert len(chain) == 2
@@ -49,3 +54,58 @@ def test_create_appends_block_and_backrefs(tmp_path: Path):
     assert chain[1]["payload"]["record_id"] == rec2_id
     assert chain[1]["prev_hash"] == chain[0]["hash"]
     assert chain[1]["hash"] == rec2["block_hash"]
+
+
+def write_legacy_chain(chain_path: Path, payloads, corrupt_tail=False):
+    """Write a chain.log in the old format (hex-encoded hashes)."""
+    prev = GENESIS
+    lines = []
+    for index, payload in enumerate(payloads):
+        digest = hashlib.sha256(
+            b"%d|%s|%s" % (index, prev, _dumps_canonical(payload))
+        ).digest()
+        lines.append(json.dumps({
+            "index": index,
+            "prev_hash": "GENESIS" if prev == GENESIS else prev.hex(),
+            "hash": digest.hex(),
+            "section": payload["type"],
+            "record_id": payload["record_id"],
+            "timestamp": "2026-01-01T00:00:00Z",
+            "payload": payload,
+        }))
+        prev = digest
+    if corrupt_tail:
+        tail = json.loads(lines[-1])
+        tail["hash"] = "00" * 32
+        lines[-1] = json.dumps(tail)
+    chain_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_legacy_hex_log_loads_and_extends(tmp_path: Path):
+    chain_path = tmp_path / "chain.log"
+    write_legacy_chain(chain_path, [
+        {"type": "glyphs", "record_id": "a", "data": {"x": 1}},
+        {"type": "glyphs", "record_id": "b", "data": {"x": 2}},
+    ])
+
+    adapter = BloomChainAdapter(chain_path)
+    assert adapter.verify(full=True)
+    adapter.append_event("glyphs", "c", {"x": 3})
+    adapter.flush()
+
+    # The mixed-format log (hex tail, base64 new block) must reload cleanly.
+    reloaded = BloomChainAdapter(chain_path)
+    assert len(reloaded.blocks()) == 3
+    assert reloaded.verify(full=True)
+
+
+def test_append_refused_on_corrupt_tail(tmp_path: Path):
+    chain_path = tmp_path / "chain.log"
+    write_legacy_chain(chain_path, [
+        {"type": "glyphs", "record_id": "a", "data": {"x": 1}},
+        {"type": "glyphs", "record_id": "b", "data": {"x": 2}},
+    ], corrupt_tail=True)
+
+    adapter = BloomChainAdapter(chain_path)
+    with pytest.raises(RuntimeError, match="refusing to append"):
+        adapter.append_event("glyphs", "c", {"x": 3})
@@ -21,6 +21,7 @@ def test_verify_report_ok(tmp_path: Path):
     gid = store.create_record("glyphs", {"token": "I-Glyph", "size": 32})
     eid = store.create_record("mrp_embeds", {"cover": "c.png", "message": "hi"})
 
+    adapter.flush()
     rep = verify(state_path, chain_path)
     assert rep["ok"] is True
     assert rep["link_ok"] is True
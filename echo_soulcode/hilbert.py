@@ -1,7 +1,13 @@
 from __future__ import annotations
+import cmath
 import math
 from dataclasses import dataclass
 
+try:  # NumPy is optional; batch helpers fall back to scalar loops without it.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
 @dataclass(frozen=True)
 class HilbertState:
     alpha: float
@@ -32,6 +38,40 @@ def dominant_frequency(beta: float, gamma: float, f0: float = 13.0) -> float:
 def to_complex(alpha: float, beta: float, gamma: float,
                pha: float=0.0, phb: float=0.0, phg: float=0.0) -> tuple[complex,complex,complex]:
     """Return complex amplitudes from magnitudes and phases (radians)."""
-    return (alpha*complex(math.cos(pha), math.sin(pha)),
-            beta*complex(math.cos(phb), math.sin(phb)),
-            gamma*complex(math.cos(phg), math.sin(phg)))
+    # cmath.rect computes cos+sin in one libm call and skips the Python
+    # complex() constructor.
+    return (cmath.rect(alpha, pha), cmath.rect(beta, phb), cmath.rect(gamma, phg))
+
+
+# ---- Batched variants: one vectorized call over (N, 3) arrays ----
+
+def normalize_batch(abg):
+    """Normalize rows of an (N, 3) magnitude array; zero rows pass through."""
+    if np is None:
+        return [list(normalize(*row)) for row in abg]
+    abg = np.asarray(abg, dtype=float)
+    norms = np.linalg.norm(abg, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return abg / norms
+
+def phase_shift_batch(abg):
+    """Vectorized phase_shift over rows of an (N, 3) array."""
+    if np is None:
+        return [phase_shift(*row) for row in abg]
+    abg = np.asarray(abg, dtype=float)
+    return np.arctan2(abg[:, 2], abg[:, 0] + abg[:, 1])
+
+def dominant_frequency_batch(abg, f0: float = 13.0):
+    """Vectorized dominant_frequency over rows of an (N, 3) array."""
+    if np is None:
+        return [dominant_frequency(row[1], row[2], f0) for row in abg]
+    abg = np.asarray(abg, dtype=float)
+    return f0 + 2.0 * (abg[:, 1] - abg[:, 2])
+
+def to_complex_batch(mag, phase):
+    """Complex amplitudes for (N, 3) magnitude and phase arrays."""
+    if np is None:
+        return [list(to_complex(*m, *p)) for m, p in zip(mag, phase)]
+    mag = np.asarray(mag, dtype=float)
+    phase = np.asarray(phase, dtype=float)
+    return mag * np.exp(1j * phase)